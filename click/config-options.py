@@ -4,6 +4,7 @@ Getting missing click command options from a config file
 This example uses JSON for the config file.
 """
 
+from functools import partial
 import json
 from pathlib import Path
 
@@ -16,6 +17,9 @@ DEFAULT_CONF_NAME = '.default.json'
 class Config:
     def __init__(self):
         self.config = {}
+        # Flattened (section, field) -> value; updated in place on load so
+        # that defaults bound before loading still see the loaded values
+        self._fields = {}
 
     def __repr__(self):
         items = ", ".join(f"{key}={val}" for key, val in self.config.items())
@@ -31,11 +35,16 @@ class Config:
         else:
             self.config = {}
 
-    def default(self, section, field):
-        def default_map():
-            return (self.config or {}).get(section, {}).get(field)
+        self._fields.clear()
+        self._fields.update(
+            ((section, field), value)
+            for section, fields in (self.config or {}).items()
+            if isinstance(fields, dict)
+            for field, value in fields.items()
+        )
 
-        return default_map
+    def default(self, section, field):
+        return partial(self._fields.get, (section, field))
 
 
 config = Config()
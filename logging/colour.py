@@ -32,9 +32,11 @@ class ColorLogFormatter(logging.Formatter):
         # be added to the message according to the default log formatter
         # behaviour
         super().__init__(fmt='%(message)s')
+        self._prefixes = {
+            level: color + ('[DEBUG] ' if level == logging.DEBUG else '')
+            for level, color in self.COLORS.items()
+        }
 
     def format(self, record):
         msg = super().format(record)
-        if record.levelno == logging.DEBUG:
-            msg = '[DEBUG] ' + msg
-        return f'{self.COLORS[record.levelno]}{msg}{self.reset}'
+        return self._prefixes.get(record.levelno, '') + msg + self.reset
@@ -15,7 +15,7 @@ from concurrent import futures
 import logging
 from logging.handlers import QueueHandler
 import multiprocessing
-from queue import Queue  # needed for mypy
+from multiprocessing.queues import Queue  # needed for mypy
 import time
 from typing import TypeAlias
 
@@ -25,14 +25,19 @@ from tqdm.contrib.logging import tqdm_logging_redirect
 logger = logging.getLogger(__name__)
 
 
-DataQueue: TypeAlias = Queue[logging.LogRecord | int]
+DataQueue: TypeAlias = 'Queue[logging.LogRecord | int]'
 
 
-def sleep(millis: int, log_queue: DataQueue) -> int:
-    handler = QueueHandler(log_queue)
+def _init_worker(log_queue: DataQueue) -> None:
+    # Configure logging once per worker process rather than once per task.
+    # The queue is passed here rather than to each task since a
+    # multiprocessing.Queue can only be shared through inheritance
     root = logging.getLogger()
-    root.handlers.clear()  # Need this otherwise will get double logging
-    root.addHandler(handler)
+    # Replace the handlers otherwise will get double logging
+    root.handlers[:] = [QueueHandler(log_queue)]
+
+
+def sleep(millis: int) -> int:
     logger = logging.getLogger(
         f'{__name__}.{multiprocessing.current_process().name}'
     )
@@ -50,8 +55,10 @@ def executor_runner(
     as_completed: bool,
     workers: None | int,
 ) -> None:
-    with futures.ProcessPoolExecutor(workers) as ex:
-        fs = [ex.submit(sleep, x, queue) for x in args]
+    with futures.ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(queue,)
+    ) as ex:
+        fs = [ex.submit(sleep, x) for x in args]
         for future in (futures.as_completed(fs) if as_completed else fs):
             queue.put(future.result())
         logger.debug('Finished as_completed')
@@ -71,34 +78,36 @@ def main(n: int, as_completed: bool, workers: int | None = None) -> None:
         raise ValueError('n must be > 0')
 
     logger.debug('Starting multiprocessing pool...')
-    with multiprocessing.Manager() as m:
-        queue: DataQueue = m.Queue(-1)
-        args = list(range(n, 0, -1))
-
-        # Have to use a process since forking from a multithreaded process is
-        # unsafe; see fork(2)
-        executor_process = multiprocessing.Process(
-            target=executor_runner,
-            args=(args, queue, as_completed, workers)
-        )
-
-        executor_process.start()
-
-        num = 0
-        with tqdm_logging_redirect(total=n) as pbar:
-            while num < n:
-                r = queue.get()
-                if isinstance(r, logging.LogRecord):
-                    logger.handle(r)
-                else:
-                    logger.info(f'Returned: {r}')
-                    num += 1
-                    pbar.update(1)
-
-        logger.debug('Joining...')
-        executor_process.join()
-        logger.debug('Joined')
-    logger.debug('Closed manager')
+    queue: DataQueue = multiprocessing.Queue(-1)
+    args = list(range(n, 0, -1))
+
+    # Have to use a process since forking from a multithreaded process is
+    # unsafe; see fork(2)
+    executor_process = multiprocessing.Process(
+        target=executor_runner,
+        args=(args, queue, as_completed, workers)
+    )
+
+    executor_process.start()
+
+    num = 0
+    with tqdm_logging_redirect(total=n) as pbar:
+        while num < n:
+            r = queue.get()
+            if isinstance(r, logging.LogRecord):
+                logger.handle(r)
+            else:
+                logger.info(f'Returned: {r}')
+                num += 1
+                pbar.update(1)
+
+    queue.close()
+    queue.join_thread()
+    logger.debug('Closed queue')
+
+    logger.debug('Joining...')
+    executor_process.join()
+    logger.debug('Joined')
 
 
 def parse_args():
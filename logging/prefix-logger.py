@@ -4,6 +4,7 @@ Context manager for prefixing log messages
 
 from contextlib import contextmanager
 import logging
+import threading
 from typing import Callable, cast
 
 import pytest
@@ -12,27 +13,76 @@ import pytest
 logger = logging.getLogger(__name__)
 
 
+_prefix_local = threading.local()
+
+# The handler formatters are shared by all threads, so they are patched by
+# whichever context is entered first in the process and restored once the
+# last context exits
+_patch_lock = threading.Lock()
+_patch_depth = 0
+_patched_formats: list[
+    tuple[logging.Formatter, Callable[[logging.LogRecord], str]]
+] = []
+
+
+def _prefix_stack() -> list[str]:
+    try:
+        return _prefix_local.stack
+    except AttributeError:
+        _prefix_local.stack = []
+        return _prefix_local.stack
+
+
+def _patch_formatters() -> None:
+    logger = logging.getLogger()
+    for handler in logger.handlers:
+        formatter = handler.formatter
+        # Handlers may share a formatter, which must only be patched once
+        if formatter is None or any(
+            formatter is patched for patched, _ in _patched_formats
+        ):
+            continue
+
+        def format(
+            record: logging.LogRecord,
+            old_format=formatter.format,
+        ) -> str:
+            # Cast to avoid mypy error (not sure why there is one)
+            return ''.join(_prefix_stack()) + cast(
+                Callable[[logging.LogRecord], str],
+                old_format
+            )(record)
+
+        _patched_formats.append((formatter, formatter.format))
+        setattr(formatter, 'format', format)
+
+
+def _restore_formatters() -> None:
+    for formatter, old_format in reversed(_patched_formats):
+        setattr(formatter, 'format', old_format)
+    _patched_formats.clear()
+
+
 @contextmanager
 def prefix_logging(prefix: str):
+    global _patch_depth
+
+    stack = _prefix_stack()
+    stack.append(prefix)
     try:
-        logger = logging.getLogger()
-        formatters = [h.formatter for h in logger.handlers]
-        format_methods = [f.format if f else None for f in formatters]
-        for formatter, old_format in zip(formatters, format_methods):
-            if formatter is not None and old_format is not None:
-                def format(record: logging.LogRecord) -> str:
-                    # Cast to avoid mypy error (not sure why there is one)
-                    return prefix + cast(
-                        Callable[[logging.LogRecord], str],
-                        old_format
-                    )(record)
-
-                setattr(formatter, 'format', format)
-        yield
+        with _patch_lock:
+            if _patch_depth == 0:
+                _patch_formatters()
+            _patch_depth += 1
+        try:
+            yield
+        finally:
+            with _patch_lock:
+                _patch_depth -= 1
+                if _patch_depth == 0:
+                    _restore_formatters()
     finally:
-        for formatter, old_method in zip(formatters, format_methods):
-            if formatter is not None:
-                setattr(formatter, 'format', old_method)
+        stack.pop()
 
 
 def log_func(msg):
@@ -56,3 +106,35 @@ INFO Hello, World!
   INFO From a function
 INFO Should be unindented
 """.lstrip()
+
+
+def test_threads(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG)
+    formatter = caplog.handler.formatter
+    assert formatter is not None
+    original_format = formatter.format
+
+    # Make both threads be inside their contexts at the same time
+    entered = threading.Barrier(2)
+    logged = threading.Barrier(2)
+
+    def run(prefix: str, name: str) -> None:
+        with prefix_logging(prefix):
+            entered.wait()
+            logger.info(f'from {name}')
+            logged.wait()
+
+    threads = [
+        threading.Thread(target=run, args=('A>', 'A')),
+        threading.Thread(target=run, args=('B>', 'B')),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(caplog.text.splitlines()) == [
+        'A>INFO from A',
+        'B>INFO from B',
+    ]
+    assert formatter.format == original_format